@@ -11,7 +11,7 @@ from bimmer_connected.const import SERVICE_STATUS, VEHICLE_STATUS_URL, SERVICE_L
     VEHICLE_NAVIGATION
 
 from bimmer_connected.vehicle_status import VehicleStatus, LockState, ParkingLightState, ChargingState, \
-    CheckControlMessage, ConditionBasedServiceReport, Lid, Window
+    CheckControlMessage, ConditionBasedServiceReport, Lid, Window, _parse_datetime
 from bimmer_connected.last_trip import LastTrip
 from bimmer_connected.all_trips import AllTrips
 from bimmer_connected.charging_profile import ChargingProfile
@@ -69,6 +69,8 @@ class VehicleState:
             SERVICE_RANGEMAP: VEHICLE_RANGEMAP_URL,
             SERVICE_EFFICIENCY: VEHICLE_EFFICIENCY,
             SERVICE_NAVIGATION: VEHICLE_NAVIGATION}
+        # server url and vin do not change, so the urls are only formatted on the first update
+        self._formatted_url = None
 
         self._key = {
             SERVICE_STATUS: 'vehicleStatus',
@@ -94,15 +96,20 @@ class VehicleState:
             'dlon': self._vehicle.observer_longitude,
         }
 
+        if self._formatted_url is None:
+            self._formatted_url = {
+                service: url.format(server=self._account.server_url, vin=self._vehicle.vin)
+                for service, url in self._url.items()}
+
         for service in self._vehicle.available_state_services:
             try:
                 response = self._account.send_request(
-                    self._url[service].format(server=self._account.server_url, vin=self._vehicle.vin),
-                    logfilename=service, params=params)
+                    self._formatted_url[service], logfilename=service, params=params)
+                data = response.json()
                 if not self._key[service]:
-                    self._attributes[service] = response.json()
+                    self._attributes[service] = data
                 else:
-                    self._attributes[service] = response.json()[self._key[service]]
+                    self._attributes[service] = data[self._key[service]]
             except IOError:
                 _LOGGER.debug('Service %s failed', service)
             except KeyError:  # When JSON contains no service-key
@@ -127,8 +134,7 @@ class VehicleState:
     @staticmethod
     def _parse_datetime(date_str: str) -> datetime.datetime:
         """Convert a time string into datetime."""
-        date_format = "%Y-%m-%dT%H:%M:%S%z"
-        return datetime.datetime.strptime(date_str, date_format)
+        return _parse_datetime(date_str)
 
     @property
     @backend_parameter
@@ -3,6 +3,7 @@
 import datetime
 import logging
 from enum import Enum
+from functools import lru_cache
 from typing import List
 
 from bimmer_connected.const import SERVICE_STATUS
@@ -10,11 +11,22 @@ from bimmer_connected.const import SERVICE_STATUS
 _LOGGER = logging.getLogger(__name__)
 
 
-LIDS = ['doorDriverFront', 'doorPassengerFront', 'doorDriverRear', 'doorPassengerRear',
-        'hood', 'trunk']
+LIDS = ('doorDriverFront', 'doorPassengerFront', 'doorDriverRear', 'doorPassengerRear',
+        'hood', 'trunk')
 
-WINDOWS = ['windowDriverFront', 'windowPassengerFront', 'windowDriverRear', 'windowPassengerRear', 'rearWindow',
-           'sunroof']
+WINDOWS = ('windowDriverFront', 'windowPassengerFront', 'windowDriverRear', 'windowPassengerRear', 'rearWindow',
+           'sunroof')
+
+#: position states reported by the server if vehicle tracking is disabled
+TRACKING_DISABLED_STATES = ('DRIVER_DISABLED', 'TOO_FAR_AWAY')
+
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
+#: formats of the CBS due dates, by the separator used in the string
+CBS_DATE_FORMATS = {
+    '-': '%Y-%m',
+    '.': '%m.%Y',
+}
 
 
 class LidState(Enum):
@@ -26,6 +38,9 @@ class LidState(Enum):
     INVALID = 'INVALID'
 
 
+_LID_STATE_BY_VALUE = {state.value: state for state in LidState}
+
+
 class LockState(Enum):
     """Possible states of the door locks."""
     LOCKED = 'LOCKED'
@@ -34,6 +49,9 @@ class LockState(Enum):
     UNLOCKED = 'UNLOCKED'
 
 
+_LOCK_STATE_BY_VALUE = {state.value: state for state in LockState}
+
+
 class ParkingLightState(Enum):
     """Possible states of the parking lights"""
     LEFT = 'LEFT'
@@ -41,6 +59,9 @@ class ParkingLightState(Enum):
     OFF = 'OFF'
 
 
+_PARKING_LIGHT_STATE_BY_VALUE = {state.value: state for state in ParkingLightState}
+
+
 class ConditionBasedServiceStatus(Enum):
     """Status of the condition based services."""
     OK = 'OK'
@@ -48,6 +69,9 @@ class ConditionBasedServiceStatus(Enum):
     PENDING = 'PENDING'
 
 
+_CBS_STATUS_BY_VALUE = {state.value: state for state in ConditionBasedServiceStatus}
+
+
 class ChargingState(Enum):
     """Charging state of electric vehicle."""
     CHARGING = 'CHARGING'
@@ -59,6 +83,39 @@ class ChargingState(Enum):
     WAITING_FOR_CHARGING = 'WAITING_FOR_CHARGING'
 
 
+@lru_cache(maxsize=128)
+def _parse_datetime(date_str: str) -> datetime.datetime:
+    """Convert a time string into datetime.
+
+    The same timestamps are received over and over again while polling, so the results are cached.
+    """
+    # fromisoformat() only accepts offsets like "+01:00", the server sends "+0100"
+    iso_str = date_str
+    if iso_str.endswith('Z'):
+        iso_str = iso_str[:-1] + '+00:00'
+    elif len(iso_str) > 5 and iso_str[-5] in '+-':
+        iso_str = iso_str[:-2] + ':' + iso_str[-2:]
+    try:
+        return datetime.datetime.fromisoformat(iso_str)
+    except (AttributeError, ValueError):  # fromisoformat() is not available before Python 3.7
+        return datetime.datetime.strptime(date_str, DATETIME_FORMAT)
+
+
+@lru_cache(maxsize=128)
+def _parse_date(datestr: str) -> datetime.datetime:
+    """Convert the due date of a condition based service into datetime."""
+    if datestr is None:
+        return None
+    for separator, date_format in CBS_DATE_FORMATS.items():
+        if separator in datestr:
+            try:
+                return datetime.datetime.strptime(datestr, date_format).replace(day=1)
+            except ValueError:
+                break
+    _LOGGER.error('Unknown time format for CBS: %s', datestr)
+    return None
+
+
 class CheckControlMessage:
     """Check control message sent from the server.
 
@@ -96,8 +153,7 @@ def backend_parameter(func):
     """
     def _func_wrapper(self: 'VehicleStatus', *args, **kwargs):
         # pylint: disable=protected-access
-        if self._state.attributes[SERVICE_STATUS] is None:
-            raise ValueError('No data available for vehicle status!')
+        self._require_attributes()
         try:
             return func(self, *args, **kwargs)
         except KeyError:
@@ -106,40 +162,83 @@ def backend_parameter(func):
     return _func_wrapper
 
 
+def cached_backend_parameter(func):
+    """Decorator for parameters reading data from the backend, caching the parsed result.
+
+    Errors are handled like in :func:`backend_parameter`. The cache is tied to the status
+    data it was computed from and is discarded as soon as new data was received.
+    """
+    name = func.__name__
+    func = backend_parameter(func)
+
+    def _func_wrapper(self: 'VehicleStatus'):
+        # pylint: disable=protected-access
+        attributes = self._state.attributes[SERVICE_STATUS]
+        if attributes is not self._cache_source:
+            self._cache = {}
+            self._cache_source = attributes
+        if name not in self._cache:
+            self._cache[name] = func(self)
+        return self._cache[name]
+    return _func_wrapper
+
+
 class VehicleStatus:  # pylint: disable=too-many-public-methods
     """Models the status of a vehicle."""
 
     def __init__(self, state):
         """Constructor."""
         self._state = state
+        self._cache = {}
+        self._cache_source = None
+
+    def _require_attributes(self) -> dict:
+        """Get the status data, raising ValueError if no data is available."""
+        attributes = self._state.attributes[SERVICE_STATUS]
+        if attributes is None:
+            raise ValueError('No data available for vehicle status!')
+        return attributes
+
+    def _get_attribute(self, key: str):
+        """Get a plain attribute from the status data, None if it is missing."""
+        value = self._require_attributes().get(key)
+        if value is None:
+            _LOGGER.debug('No data available for attribute %s!', key)
+        return value
+
+    def _get_int_attribute(self, key: str) -> int:
+        """Get an attribute from the status data as int, None if it is missing."""
+        value = self._get_attribute(key)
+        if value is None:
+            return None
+        return int(value)
 
     @property
-    @backend_parameter
     def attributes(self) -> dict:
         """Retrieve all attributes from the sever.
 
         This does not parse the results in any way.
         """
-        return self._state.attributes[SERVICE_STATUS]
+        return self._require_attributes()
 
     @property
-    @backend_parameter
+    @cached_backend_parameter
     def timestamp(self) -> datetime.datetime:
         """Get the timestamp when the data was recorded."""
-        return self._parse_datetime(self._state.attributes[SERVICE_STATUS]['updateTime'])
+        return _parse_datetime(self._state.attributes[SERVICE_STATUS]['updateTime'])
 
     @property
-    @backend_parameter
+    @cached_backend_parameter
     def gps_position(self) -> (float, float):
         """Get the last known position of the vehicle.
 
         Returns a tuple of (latitude, longitude).
         This only provides data, if the vehicle tracking is enabled!
         """
-        if not self.is_vehicle_tracking_enabled:
+        pos = self._state.attributes[SERVICE_STATUS]['position']
+        if pos['status'] in TRACKING_DISABLED_STATES:
             _LOGGER.warning('Vehicle tracking is disabled')
             return None
-        pos = self._state.attributes[SERVICE_STATUS]['position']
         return float(pos['lat']), float(pos['lon'])
 
     @property
@@ -149,10 +248,10 @@ class VehicleStatus:  # pylint: disable=too-many-public-methods
 
         This only provides data, if the vehicle tracking is enabled!
         """
-        if not self.is_vehicle_tracking_enabled:
+        pos = self._state.attributes[SERVICE_STATUS]['position']
+        if pos['status'] in TRACKING_DISABLED_STATES:
             _LOGGER.warning('Vehicle tracking is disabled')
             return None
-        pos = self._state.attributes[SERVICE_STATUS]['position']
         return int(pos['heading'])
 
     @property
@@ -162,45 +261,38 @@ class VehicleStatus:  # pylint: disable=too-many-public-methods
 
         The server return "OK" if tracking is enabled and "DRIVER_DISABLED" if it is disabled in the vehicle.
         """
-        return self._state.attributes[SERVICE_STATUS]['position']['status'] not in ['DRIVER_DISABLED', 'TOO_FAR_AWAY']
+        return self._state.attributes[SERVICE_STATUS]['position']['status'] not in TRACKING_DISABLED_STATES
 
     @property
-    @backend_parameter
     def mileage(self) -> int:
         """Get the mileage of the vehicle.
 
         Returns a tuple of (value, unit_of_measurement)
         """
-        return int(self._state.attributes[SERVICE_STATUS]['mileage'])
+        return self._get_int_attribute('mileage')
 
     @property
-    @backend_parameter
     def remaining_range_fuel(self) -> int:
         """Get the remaining range of the vehicle on fuel.
 
         Returns a tuple of (value, unit_of_measurement)
         """
-        return int(self._state.attributes[SERVICE_STATUS]['remainingRangeFuel'])
+        return self._get_int_attribute('remainingRangeFuel')
 
     @property
-    @backend_parameter
     def remaining_fuel(self) -> int:
         """Get the remaining fuel of the vehicle.
 
         Returns a tuple of (value, unit_of_measurement)
         """
-        return int(self._state.attributes[SERVICE_STATUS]['remainingFuel'])
+        return self._get_int_attribute('remainingFuel')
 
     @property
-    @backend_parameter
+    @cached_backend_parameter
     def lids(self) -> List['Lid']:
         """Get all lids (doors+hatch+trunk) of the car."""
-        result = []
-        for lid in LIDS:
-            if lid in self._state.attributes[SERVICE_STATUS] and \
-                    self._state.attributes[SERVICE_STATUS][lid] != LidState.INVALID.value:
-                result.append(Lid(self, lid))
-        return result
+        attributes = self._state.attributes[SERVICE_STATUS]
+        return [Lid(self, lid) for lid in LIDS if attributes.get(lid, LidState.INVALID.value) != LidState.INVALID.value]
 
     @property
     def open_lids(self) -> List['Lid']:
@@ -210,18 +302,15 @@ class VehicleStatus:  # pylint: disable=too-many-public-methods
     @property
     def all_lids_closed(self) -> bool:
         """Check if all lids are closed."""
-        return len(list(self.open_lids)) == 0
+        return all(lid.is_closed for lid in self.lids)
 
     @property
-    @backend_parameter
+    @cached_backend_parameter
     def windows(self) -> List['Window']:
         """Get all windows (doors+sun roof) of the car."""
-        result = []
-        for window in WINDOWS:
-            if window in self._state.attributes[SERVICE_STATUS] and \
-                    self._state.attributes[SERVICE_STATUS][window] != LidState.INVALID.value:
-                result.append(Window(self, window))
-        return result
+        attributes = self._state.attributes[SERVICE_STATUS]
+        return [Window(self, window) for window in WINDOWS
+                if attributes.get(window, LidState.INVALID.value) != LidState.INVALID.value]
 
     @property
     def open_windows(self) -> List['Window']:
@@ -231,54 +320,52 @@ class VehicleStatus:  # pylint: disable=too-many-public-methods
     @property
     def all_windows_closed(self) -> bool:
         """Check if all windows are closed."""
-        return len(list(self.open_windows)) == 0
+        return all(window.is_closed for window in self.windows)
 
     @property
-    @backend_parameter
+    @cached_backend_parameter
     def door_lock_state(self) -> LockState:
         """Get state of the door locks."""
-        return LockState(self._state.attributes[SERVICE_STATUS]['doorLockState'])
+        state = self._state.attributes[SERVICE_STATUS]['doorLockState']
+        return _LOCK_STATE_BY_VALUE.get(state) or LockState(state)
 
     @property
-    @backend_parameter
     def last_update_reason(self) -> str:
         """The reason for the last state update"""
-        return self._state.attributes[SERVICE_STATUS]['updateReason']
+        return self._get_attribute('updateReason')
 
     @property
-    @backend_parameter
     def last_charging_end_result(self) -> str:
         """Get the last charging end result"""
-        return self._state.attributes[SERVICE_STATUS]['lastChargingEndResult']
+        return self._get_attribute('lastChargingEndResult')
 
     @property
-    @backend_parameter
     def connection_status(self) -> str:
         """Get status of the connection"""
-        return self._state.attributes[SERVICE_STATUS]['connectionStatus']
+        return self._get_attribute('connectionStatus')
 
     @property
-    @backend_parameter
+    @cached_backend_parameter
     def condition_based_services(self) -> List['ConditionBasedServiceReport']:
         """Get status of the condition based services."""
         return [ConditionBasedServiceReport(s) for s in self._state.attributes[SERVICE_STATUS]['cbsData']]
 
     @property
+    @backend_parameter
     def are_all_cbs_ok(self) -> bool:
         """Check if the status of all condition based services is "OK"."""
-        for cbs in self.condition_based_services:
-            if cbs.state != ConditionBasedServiceStatus.OK:
-                return False
-        return True
+        return all(cbs['cbsState'] == ConditionBasedServiceStatus.OK.value
+                   for cbs in self._state.attributes[SERVICE_STATUS]['cbsData'])
 
     @property
-    @backend_parameter
+    @cached_backend_parameter
     def parking_lights(self) -> ParkingLightState:
         """Get status of parking lights.
 
         :returns None if status is unknown.
         """
-        return ParkingLightState(self._state.attributes[SERVICE_STATUS]['parkingLight'])
+        state = self._state.attributes[SERVICE_STATUS]['parkingLight']
+        return _PARKING_LIGHT_STATE_BY_VALUE.get(state) or ParkingLightState(state)
 
     @property
     def are_parking_lights_on(self) -> bool:
@@ -291,21 +378,14 @@ class VehicleStatus:  # pylint: disable=too-many-public-methods
             return None
         return lights != ParkingLightState.OFF
 
-    @staticmethod
-    def _parse_datetime(date_str: str) -> datetime.datetime:
-        """Convert a time string into datetime."""
-        date_format = "%Y-%m-%dT%H:%M:%S%z"
-        return datetime.datetime.strptime(date_str, date_format)
-
     def __getattr__(self, item):
         """Generic get function for all backend attributes."""
         return self._state.attributes[SERVICE_STATUS][item]
 
     @property
-    @backend_parameter
     def remaining_range_electric(self) -> int:
         """Remaining range on battery, in kilometers."""
-        return int(self._state.attributes[SERVICE_STATUS]['remainingRangeElectric'])
+        return self._get_int_attribute('remainingRangeElectric')
 
     @property
     @backend_parameter
@@ -315,17 +395,18 @@ class VehicleStatus:  # pylint: disable=too-many-public-methods
         That is electrical range + fuel range.
         """
         result = 0
-        if self.remaining_range_electric is not None:
-            result += self.remaining_range_electric
-        if self.remaining_range_fuel is not None:
-            result += self.remaining_range_fuel
+        range_electric = self.remaining_range_electric
+        if range_electric is not None:
+            result += range_electric
+        range_fuel = self.remaining_range_fuel
+        if range_fuel is not None:
+            result += range_fuel
         return result
 
     @property
-    @backend_parameter
     def max_range_electric(self) -> int:
         """ This can change with driving style and temperature in kilometers."""
-        return int(self._state.attributes[SERVICE_STATUS]['maxRangeElectric'])
+        return self._get_int_attribute('maxRangeElectric')
 
     @property
     @backend_parameter
@@ -342,16 +423,14 @@ class VehicleStatus:  # pylint: disable=too-many-public-methods
         return datetime.timedelta(minutes=minutes)
 
     @property
-    @backend_parameter
     def charging_level_hv(self) -> int:
         """State of charge of the high voltage battery in percent."""
-        return int(self._state.attributes[SERVICE_STATUS]['chargingLevelHv'])
+        return self._get_int_attribute('chargingLevelHv')
 
     @property
-    @backend_parameter
     def fuel_percent(self) -> int:
         """State of fuel in percent."""
-        return int(self._state.attributes[SERVICE_STATUS]['fuelPercent'])
+        return self._get_int_attribute('fuelPercent')
 
     @property
     @backend_parameter
@@ -375,6 +454,8 @@ class Lid:  # pylint: disable=too-few-public-methods
     Lids are: Doors + Trunk + Hatch
     """
 
+    __slots__ = ('name', '_vehicle_status')
+
     def __init__(self, vehicle_status: VehicleStatus, name: str):
         #: name of the lid
         self.name = name
@@ -383,12 +464,13 @@ class Lid:  # pylint: disable=too-few-public-methods
     @property
     def state(self):
         """Get the current state of the lid."""
-        return LidState(getattr(self._vehicle_status, self.name))
+        state = self._vehicle_status.attributes[self.name]
+        return _LID_STATE_BY_VALUE.get(state) or LidState(state)
 
     @property
     def is_closed(self) -> bool:
         """Check if the lid is closed."""
-        return self.state == LidState.CLOSED
+        return self.state is LidState.CLOSED
 
     def __str__(self) -> str:
         return '{}: {}'.format(self.name, self._vehicle_status)
@@ -400,17 +482,21 @@ class Window(Lid):  # pylint: disable=too-few-public-methods
     A window can be a normal window of the car or the sun roof.
     """
 
+    __slots__ = ()
+
 
 class ConditionBasedServiceReport:  # pylint: disable=too-few-public-methods
     """Entry in the list of condition based services."""
 
+    __slots__ = ('due_date', 'state', 'service_type', 'due_distance', 'description')
+
     def __init__(self, data: dict):
 
         #: date when the service is due
-        self.due_date = self._parse_date(data.get('cbsDueDate'))
+        self.due_date = _parse_date(data.get('cbsDueDate'))
 
         #: status of the service
-        self.state = ConditionBasedServiceStatus(data['cbsState'])
+        self.state = _CBS_STATUS_BY_VALUE.get(data['cbsState']) or ConditionBasedServiceStatus(data['cbsState'])
 
         #: service type
         self.service_type = data['cbsType']
@@ -422,20 +508,3 @@ class ConditionBasedServiceReport:  # pylint: disable=too-few-public-methods
 
         #: description of the required service
         self.description = data['cbsDescription']
-
-    @staticmethod
-    def _parse_date(datestr: str) -> datetime.datetime:
-        if datestr is None:
-            return None
-        formats = [
-            '%Y-%m',
-            '%m.%Y',
-        ]
-        for date_format in formats:
-            try:
-                date = datetime.datetime.strptime(datestr, date_format)
-                return date.replace(day=1)
-            except ValueError:
-                pass
-        _LOGGER.error('Unknown time format for CBS: %s', datestr)
-        return None
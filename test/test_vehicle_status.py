@@ -9,7 +9,7 @@ from bimmer_connected.account import ConnectedDriveAccount
 from bimmer_connected.state import VehicleState
 from bimmer_connected.const import SERVICE_STATUS
 from bimmer_connected.vehicle_status import LidState, LockState, ConditionBasedServiceStatus, \
-    ParkingLightState, ChargingState
+    ParkingLightState, ChargingState, _parse_date
 
 G31_TEST_DATA = load_response_json('G31_NBTevo/status.json')
 G31_NO_POSITION_TEST_DATA = load_response_json('G31_NBTevo/status_position_disabled.json')
@@ -129,6 +129,13 @@ class TestState(unittest.TestCase):
         self.assertEqual(datetime.datetime(year=2018, month=3, day=10, hour=11, minute=39, second=41, tzinfo=zone),
                          VehicleState._parse_datetime(date))
 
+    def test_parse_cbs_dateformat(self):
+        """Test parsing of the due dates of condition based services."""
+        self.assertEqual(datetime.datetime(year=2020, month=1, day=1), _parse_date('2020-01'))
+        self.assertEqual(datetime.datetime(year=2019, month=7, day=1), _parse_date('07.2019'))
+        self.assertIsNone(_parse_date('2019/07'))
+        self.assertIsNone(_parse_date(None))
+
     def test_missing_attribute(self):
         """Test if error handling is working correctly."""
         account = unittest.mock.MagicMock(ConnectedDriveAccount)
@@ -201,6 +208,21 @@ class TestState(unittest.TestCase):
 
         self.assertEqual(4, len(list(state.vehicle_status.windows)))
 
+    def test_cached_parameters(self):
+        """Test that parsed parameters are cached until new data is received."""
+        account = unittest.mock.MagicMock(ConnectedDriveAccount)
+        state = VehicleState(account, None)
+        state._attributes[SERVICE_STATUS] = G31_TEST_DATA['vehicleStatus']
+
+        cbs = state.vehicle_status.condition_based_services
+        self.assertIs(cbs, state.vehicle_status.condition_based_services)
+        self.assertEqual(LockState.SECURED, state.vehicle_status.door_lock_state)
+
+        state._attributes[SERVICE_STATUS] = F48_TEST_DATA['vehicleStatus']
+        self.assertIsNot(cbs, state.vehicle_status.condition_based_services)
+        self.assertEqual(datetime.datetime(year=2019, month=7, day=1),
+                         state.vehicle_status.condition_based_services[0].due_date)
+
     def test_door_locks(self):
         """Test the door locks."""
         account = unittest.mock.MagicMock(ConnectedDriveAccount)